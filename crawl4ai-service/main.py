@@ -3,20 +3,28 @@ Crawl4AI Service - FastAPI Wrapper for Web Crawling
 Provides RESTful API for the Crawl4AI library
 """
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from pydantic import BaseModel, HttpUrl, Field, field_validator
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple, Union
 import asyncio
 from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig, CacheMode
+from crawl4ai.models import StringCompatibleMarkdown
 from crawl4ai.extraction_strategy import LLMExtractionStrategy, CosineStrategy
 from crawl4ai.chunking_strategy import RegexChunking, SlidingWindowChunking
 # MarkdownChunking removed in newer versions - use RegexChunking for markdown
 import redis.asyncio as redis
+import functools
 import hashlib
-import json
+import itertools
+import orjson
 import logging
-from datetime import datetime
+import os
+import threading
+import zstandard as zstd
+from cachetools import TTLCache
+import time
+from datetime import datetime, timezone
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -26,12 +34,74 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Crawl4AI Service",
     description="Web crawling and content extraction service",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Redis connection
 redis_client: Optional[redis.Redis] = None
 
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+
+# Shared browser, launched once at startup and reused by every crawl
+crawler: Optional[AsyncWebCrawler] = None
+
+# Max crawls in flight on the shared browser, across /crawl and all batches
+MAX_CONCURRENT_CRAWLS = int(os.getenv("MAX_CONCURRENT_CRAWLS", "5"))
+_crawl_semaphore = asyncio.Semaphore(MAX_CONCURRENT_CRAWLS)
+
+# Batch crawls get fewer permits than the global cap (shared by all batches), so at
+# least one slot is always left for interactive /crawl requests
+BATCH_CONCURRENCY = max(1, min(
+    int(os.getenv("CRAWL_BATCH_CONCURRENCY", "3")),
+    MAX_CONCURRENT_CRAWLS - 1
+))
+_batch_semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+# Payloads above this size (chars/bytes) are (de)serialized off the event loop
+LARGE_PAYLOAD_THRESHOLD = 100_000
+
+# Cached results are stored zstd-compressed; HTML/markdown compress several-fold
+ZSTD_LEVEL = 3
+_zstd_local = threading.local()
+
+# In-process cache of decompressed results in front of Redis, bounded by total bytes.
+# Each worker has its own, so deletes are broadcast over Redis pub/sub; the cache is
+# only used while this worker is subscribed to that channel.
+LOCAL_CACHE_MAX_BYTES = int(os.getenv("LOCAL_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+LOCAL_CACHE_TTL = int(os.getenv("LOCAL_CACHE_TTL", "60"))
+_local_cache: TTLCache = TTLCache(maxsize=LOCAL_CACHE_MAX_BYTES, ttl=LOCAL_CACHE_TTL, getsizeof=len)
+CACHE_INVALIDATION_CHANNEL = "crawl:invalidate"
+_local_cache_enabled = False
+# Bumped on every invalidation so a Redis read that raced a delete isn't cached locally
+_local_cache_generation = 0
+_invalidation_task: Optional[asyncio.Task] = None
+
+# Strong references to running batch tasks so they aren't garbage collected
+_batch_tasks: set = set()
+
+# Keys Crawl4AI may use for the URL in a link dict, in priority order
+_URL_KEYS = ("href", "url", "link", "src")
+
+def _first_url(link: Dict) -> Optional[Any]:
+    """Return the first non-empty URL value from a link dict"""
+    for key in _URL_KEYS:
+        value = link.get(key)
+        if value:
+            return value
+    return None
+
+def _coerce_url(link: Any) -> str:
+    """Coerce a Crawl4AI link (dict with 'href' etc., or plain string) to a URL string"""
+    # Exact type checks first - a pointer compare, cheaper than isinstance's MRO walk
+    link_type = type(link)
+    if link_type is str:
+        return link
+    if link_type is dict or isinstance(link, dict):
+        url = _first_url(link)
+        return str(url) if url else str(link)
+    return str(link)
+
 # Pydantic models
 class CrawlRequest(BaseModel):
     url: HttpUrl
@@ -64,27 +134,15 @@ class CrawlResponse(BaseModel):
     @field_validator('links', mode='before')
     @classmethod
     def convert_links_to_strings(cls, v):
-        """Convert links from dicts to strings - handles both new and cached data"""
+        """Convert links from dicts to strings - the single place link normalization is enforced"""
         if v is None:
             return []
         if not isinstance(v, (list, tuple)):
             return []
-        converted = []
-        for link in v:
-            if isinstance(link, dict):
-                # Extract URL from dict (Crawl4AI returns links as dicts with 'href' key)
-                url = link.get("href") or link.get("url") or link.get("link") or link.get("src")
-                if url:
-                    converted.append(str(url))
-                else:
-                    # Fallback: convert entire dict to string
-                    converted.append(str(link))
-            elif isinstance(link, str):
-                converted.append(link)
-            else:
-                # Convert anything else to string
-                converted.append(str(link))
-        return converted
+        # Fresh crawls already produce strings - don't rebuild the list
+        if all(type(link) is str for link in v):
+            return v
+        return [_coerce_url(link) for link in v]
 
 class HealthResponse(BaseModel):
     status: str
@@ -94,9 +152,19 @@ class HealthResponse(BaseModel):
 # Startup/Shutdown
 @app.on_event("startup")
 async def startup_event():
-    global redis_client
+    global redis_client, crawler, _invalidation_task
+    # No browser means no crawls - fail startup so the worker exits and gets restarted
+    # instead of serving 503s for the life of the process
+    try:
+        crawler = AsyncWebCrawler(config=BrowserConfig(headless=True, verbose=False))
+        await crawler.__aenter__()
+        logger.info("Crawler started successfully")
+    except Exception as e:
+        logger.error(f"Crawler startup failed: {e}")
+        crawler = None
+        raise
+    
     try:
-        import os
         redis_host = os.getenv("REDIS_HOST", "redis")
         redis_port = os.getenv("REDIS_PORT", "6379")
         redis_password = os.getenv("REDIS_PASSWORD", "")
@@ -105,34 +173,53 @@ async def startup_event():
             redis_url = f"redis://:{redis_password}@{redis_host}:{redis_port}"
         else:
             redis_url = f"redis://{redis_host}:{redis_port}"
-        redis_client = await redis.from_url(
+        # Pooled binary client - cached values are compressed bytes, and concurrent
+        # crawls get their own connections instead of queuing on one socket
+        pool = redis.ConnectionPool.from_url(
             redis_url,
-            encoding="utf-8",
-            decode_responses=True
+            max_connections=REDIS_MAX_CONNECTIONS,
+            decode_responses=False,
+            health_check_interval=30
         )
+        redis_client = redis.Redis(connection_pool=pool)
         await redis_client.ping()
         logger.info("Redis connected successfully")
     except Exception as e:
         logger.error(f"Redis connection failed: {e}")
         redis_client = None
+    
+    if redis_client:
+        _invalidation_task = asyncio.create_task(_listen_for_invalidations())
 
 @app.on_event("shutdown")
 async def shutdown_event():
+    global crawler
+    # Stop in-flight batch crawls before the browser they run on is closed
+    for task in list(_batch_tasks):
+        task.cancel()
+    if _batch_tasks:
+        await asyncio.gather(*_batch_tasks, return_exceptions=True)
+    if crawler:
+        await crawler.__aexit__(None, None, None)
+        crawler = None
+    if _invalidation_task:
+        _invalidation_task.cancel()
+        await asyncio.gather(_invalidation_task, return_exceptions=True)
     if redis_client:
         await redis_client.close()
+        await redis_client.connection_pool.disconnect()
 
 # Helper functions
+@functools.lru_cache(maxsize=8)
 def get_chunking_strategy(strategy_name: str):
-    """Get chunking strategy based on name"""
-    strategies = {
-        "regex": RegexChunking(),
-        "markdown": RegexChunking(),  # Use RegexChunking for markdown (MarkdownChunking removed)
-        "sliding": SlidingWindowChunking()
-    }
-    return strategies.get(strategy_name, RegexChunking())
+    """Get chunking strategy based on name (one shared instance per name)"""
+    if strategy_name == "sliding":
+        return SlidingWindowChunking()
+    # 'regex', 'markdown' and unknown names use RegexChunking (MarkdownChunking removed)
+    return RegexChunking()
 
 def get_extraction_strategy(strategy_name: str):
-    """Get extraction strategy based on name"""
+    """Get extraction strategy based on name (fresh per crawl - CosineStrategy holds per-run state)"""
     if strategy_name == "cosine":
         return CosineStrategy(
             semantic_filter="",
@@ -144,40 +231,215 @@ def get_extraction_strategy(strategy_name: str):
     # For 'auto' and 'llm', we'll use default extraction
     return None
 
-async def get_cached_result(cache_key: str) -> Optional[Dict]:
-    """Get cached crawl result"""
+def _zstd_contexts() -> threading.local:
+    """Per-thread zstd contexts - they are not safe to share across threads"""
+    if not hasattr(_zstd_local, "cctx"):
+        _zstd_local.cctx = zstd.ZstdCompressor(level=ZSTD_LEVEL)
+        _zstd_local.dctx = zstd.ZstdDecompressor()
+    return _zstd_local
+
+def _encode_cached(result: Dict) -> Tuple[bytes, bytes]:
+    """Serialize and compress a crawl result for Redis, returning (json, compressed)"""
+    data = orjson.dumps(result)
+    return data, _zstd_contexts().cctx.compress(data)
+
+def _remember_local(cache_key: str, data: bytes, generation: int):
+    """Keep a result in the in-process cache, skipping entries too big to fit"""
+    if not _local_cache_enabled or generation != _local_cache_generation:
+        return
+    try:
+        _local_cache[cache_key] = data
+    except ValueError:
+        pass
+
+def _forget_local(cache_key: Optional[str] = None):
+    """Evict one key (or everything) from the in-process cache"""
+    global _local_cache_generation
+    _local_cache_generation += 1
+    if cache_key is None:
+        _local_cache.clear()
+    else:
+        _local_cache.pop(cache_key, None)
+
+async def _listen_for_invalidations():
+    """Evict keys deleted by any worker; disable the local cache while unsubscribed"""
+    global _local_cache_enabled
+    while True:
+        try:
+            async with redis_client.pubsub() as pubsub:
+                await pubsub.subscribe(CACHE_INVALIDATION_CHANNEL)
+                _local_cache_enabled = True
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        _forget_local(message["data"].decode())
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Cache invalidation listener error: {e}")
+        finally:
+            # Deletes may have been missed - drop everything until resubscribed
+            _local_cache_enabled = False
+            _forget_local()
+        await asyncio.sleep(1)
+
+def _decompress_cached(blob: bytes) -> bytes:
+    """Decompress a cached crawl result to its JSON bytes"""
+    return _zstd_contexts().dctx.decompress(blob)
+
+async def get_cached_raw(cache_key: str) -> Optional[bytes]:
+    """Get cached crawl result as JSON bytes, ready to send without re-parsing"""
     if not redis_client:
         return None
     
+    # Hot keys are served from process memory without a Redis round-trip
+    if _local_cache_enabled:
+        data = _local_cache.get(cache_key)
+        if data is not None:
+            return data
+    generation = _local_cache_generation
+    
     try:
         cached = await redis_client.get(cache_key)
         if cached:
-            return json.loads(cached)
+            if zstd.frame_content_size(cached) > LARGE_PAYLOAD_THRESHOLD:
+                data = await asyncio.to_thread(_decompress_cached, cached)
+            else:
+                data = _decompress_cached(cached)
+            _remember_local(cache_key, data, generation)
+            return data
     except Exception as e:
         logger.error(f"Cache retrieval error: {e}")
     
     return None
 
+async def get_cached_keys(cache_keys: List[str]) -> set:
+    """Return which of the given keys are cached, in a single round-trip"""
+    if not redis_client or not cache_keys:
+        return set()
+    
+    try:
+        # Pipelined EXISTS rather than MGET - no need to pull multi-MB payloads over the wire
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for key in cache_keys:
+                pipe.exists(key)
+            found = await pipe.execute()
+        return {key for key, hit in zip(cache_keys, found) if hit}
+    except Exception as e:
+        logger.error(f"Bulk cache lookup error: {e}")
+    
+    return set()
+
 async def set_cached_result(cache_key: str, result: Dict, ttl: int = 86400):
     """Cache crawl result"""
     if not redis_client:
         return
     
+    generation = _local_cache_generation
     try:
+        payload_size = (
+            len(result.get("html") or "")
+            + len(result.get("markdown") or "")
+            + len(result.get("screenshot") or "")
+        )
+        if payload_size > LARGE_PAYLOAD_THRESHOLD:
+            data, payload = await asyncio.to_thread(_encode_cached, result)
+        else:
+            data, payload = _encode_cached(result)
         await redis_client.setex(
             cache_key,
             ttl,
-            json.dumps(result)
+            payload
         )
+        _remember_local(cache_key, data, generation)
     except Exception as e:
         logger.error(f"Cache storage error: {e}")
 
+# [epoch second, formatted timestamp] - reformatted at most once per second
+_last_timestamp: List[Any] = [0, ""]
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO 8601 string with second precision"""
+    now = int(time.time())
+    if now != _last_timestamp[0]:
+        _last_timestamp[:] = [now, datetime.fromtimestamp(now, timezone.utc).isoformat(timespec="seconds")]
+    return _last_timestamp[1]
+
 def generate_cache_key(url: str, params: Dict) -> str:
     """Generate cache key for crawl request"""
-    key_data = f"{url}:{json.dumps(params, sort_keys=True)}"
-    return f"crawl:{hashlib.md5(key_data.encode()).hexdigest()}"
+    # Feed sorted params straight into the hasher - no JSON encode on the hot path
+    h = hashlib.blake2b(digest_size=16)
+    h.update(url.encode())
+    for key in sorted(params):
+        h.update(b"|")
+        h.update(key.encode())
+        h.update(b"=")
+        h.update(repr(params[key]).encode())
+    return f"crawl:{h.hexdigest()}"
+
+def _coerce_media_url(item: Any) -> str:
+    """Coerce a Crawl4AI media entry (dict with 'src'/'url', or plain value) to a URL string"""
+    if isinstance(item, dict):
+        return item.get("src", item.get("url", str(item)))
+    return str(item)
+
+def _postprocess(result: Any, request: CrawlRequest) -> Dict:
+    """Normalize a Crawl4AI result into response data (sync, CPU-bound - run off the event loop)"""
+    # Extract data
+    # Handle markdown - it might be an object with raw_markdown and fit_markdown.
+    # Crawl4AI returns a StringCompatibleMarkdown: a str whose value is raw_markdown,
+    # so read it as a plain str (public API only, no __getattr__ for the common case).
+    # hasattr probing is only the fallback for other types.
+    markdown = result.markdown
+    if type(markdown) is StringCompatibleMarkdown:
+        markdown_content = str.__str__(markdown) or markdown.fit_markdown or ""
+    elif hasattr(markdown, 'raw_markdown'):
+        markdown_content = markdown.raw_markdown or markdown.fit_markdown or ""
+    elif isinstance(markdown, str):
+        markdown_content = markdown
+    else:
+        markdown_content = str(markdown) if markdown else ""
+    
+    # Handle HTML - prefer cleaned_html if available
+    html_content = result.cleaned_html if hasattr(result, 'cleaned_html') and result.cleaned_html else (result.html or "")
+    
+    # Convert links to strings if they're dicts
+    links_dict = result.links if isinstance(result.links, dict) else {}
+    internal_links = links_dict.get("internal", []) or []
+    external_links = links_dict.get("external", []) or []
+    final_links_list = [_coerce_url(link) for link in itertools.chain(internal_links, external_links)]
+    
+    # Convert media to strings as well
+    media_dict = result.media if isinstance(result.media, dict) else {}
+    images = media_dict.get("images", [])
+    videos = media_dict.get("videos", [])
+    image_urls = [_coerce_media_url(img) for img in images]
+    video_urls = [_coerce_media_url(vid) for vid in videos]
+    
+    # Get metadata
+    metadata_dict = result.metadata if isinstance(result.metadata, dict) else {}
+    
+    logger.debug("Final links count: %d", len(final_links_list))
+    
+    return {
+        "url": str(request.url),
+        "markdown": markdown_content,
+        "html": html_content,
+        "links": final_links_list,
+        "media": {
+            "images": image_urls,
+            "videos": video_urls
+        },
+        "metadata": {
+            "title": metadata_dict.get("title", ""),
+            "description": metadata_dict.get("description", ""),
+            "keywords": metadata_dict.get("keywords", []),
+            "language": metadata_dict.get("language", ""),
+        },
+        "screenshot": result.screenshot if request.screenshot and hasattr(result, 'screenshot') else None,
+        "timestamp": _now_iso()
+    }
 
-async def perform_crawl(request: CrawlRequest) -> CrawlResponse:
+async def perform_crawl(request: CrawlRequest) -> Union[CrawlResponse, Response]:
     """Perform web crawl with specified parameters"""
     
     # Generate cache key
@@ -188,30 +450,20 @@ async def perform_crawl(request: CrawlRequest) -> CrawlResponse:
     }
     cache_key = generate_cache_key(str(request.url), cache_params)
     
-    # Check cache
-    cached_result = await get_cached_result(cache_key)
+    # Check cache - hits are stored as validated JSON, so send the bytes as-is
+    cached_result = await get_cached_raw(cache_key)
     if cached_result:
-        logger.info(f"Cache hit for {request.url}")
-        # CRITICAL: Ensure cached links are strings (backward compatibility)
-        if "links" in cached_result and cached_result["links"]:
-            cached_links = []
-            for link in cached_result["links"]:
-                if isinstance(link, dict):
-                    url = link.get("href") or link.get("url") or link.get("link") or link.get("src")
-                    cached_links.append(str(url) if url else str(link))
-                else:
-                    cached_links.append(str(link))
-            cached_result["links"] = [str(l) for l in cached_links]  # Final safety pass
-        return CrawlResponse(**cached_result)
+        logger.info("Cache hit for %s", request.url)
+        return Response(content=cached_result, media_type="application/json")
+    
+    if not crawler:
+        raise HTTPException(
+            status_code=503,
+            detail="Crawler unavailable"
+        )
     
     # Perform crawl
     try:
-        # Configure browser
-        browser_config = BrowserConfig(
-            headless=True,
-            verbose=True
-        )
-        
         # Configure chunking strategy
         chunking_strategy = get_chunking_strategy(request.chunking_strategy)
         
@@ -230,121 +482,31 @@ async def perform_crawl(request: CrawlRequest) -> CrawlResponse:
             js_code=request.js_code,
             css_selector=request.css_selector,
             page_timeout=request.timeout * 1000 if request.timeout else 30000,  # Convert to milliseconds
-            verbose=True,
+            verbose=False,
             # Additional options from self-hosting best practices
             remove_overlay_elements=True  # Remove popups/overlays for cleaner content
             # Note: cache_mode=CacheMode.BYPASS already set above (we handle caching via Redis)
         )
         
-        # Execute crawl with proper configuration
-        async with AsyncWebCrawler(config=browser_config) as crawler:
+        # Execute crawl on the shared browser
+        async with _crawl_semaphore:
             result = await crawler.arun(url=str(request.url), config=run_config)
-            
-            # Process result
-            if not result.success:
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"Crawl failed: {result.error_message}"
-                )
-            
-            # Extract data
-            # Handle markdown - it might be an object with raw_markdown and fit_markdown
-            if hasattr(result.markdown, 'raw_markdown'):
-                markdown_content = result.markdown.raw_markdown or result.markdown.fit_markdown or ""
-            elif isinstance(result.markdown, str):
-                markdown_content = result.markdown
-            else:
-                markdown_content = str(result.markdown) if result.markdown else ""
-            
-            # Handle HTML - prefer cleaned_html if available
-            html_content = result.cleaned_html if hasattr(result, 'cleaned_html') and result.cleaned_html else (result.html or "")
-            
-            # Convert links to strings if they're dicts
-            links_dict = result.links if isinstance(result.links, dict) else {}
-            internal_links = links_dict.get("internal", []) or []
-            external_links = links_dict.get("external", []) or []
-            all_links = []
-            
-            # Process all links - extract href from dicts
-            for link in list(internal_links) + list(external_links):
-                if isinstance(link, dict):
-                    # Try multiple possible keys for the URL
-                    url = link.get("href") or link.get("url") or link.get("link") or link.get("src")
-                    if url:
-                        all_links.append(str(url))
-                    else:
-                        # Fallback: convert entire dict to string representation
-                        all_links.append(str(link))
-                elif isinstance(link, str):
-                    all_links.append(link)
-                else:
-                    # Convert anything else to string
-                    all_links.append(str(link))
-            
-            # Convert media to strings as well
-            media_dict = result.media if isinstance(result.media, dict) else {}
-            images = media_dict.get("images", [])
-            videos = media_dict.get("videos", [])
-            image_urls = []
-            video_urls = []
-            
-            for img in images:
-                if isinstance(img, dict):
-                    image_urls.append(img.get("src", img.get("url", str(img))))
-                else:
-                    image_urls.append(str(img))
-            
-            for vid in videos:
-                if isinstance(vid, dict):
-                    video_urls.append(vid.get("src", vid.get("url", str(vid))))
-                else:
-                    video_urls.append(str(vid))
-            
-            # Get metadata
-            metadata_dict = result.metadata if isinstance(result.metadata, dict) else {}
-            
-            # Debug: Verify links are strings
-            logger.info(f"Links before validation: {all_links[:3] if all_links else []}")
-            logger.info(f"Link types: {[type(l).__name__ for l in all_links[:3]] if all_links else []}")
-            
-            # CRITICAL: Final conversion - ensure ALL links are strings before creating response_data
-            # This must happen BEFORE response_data is created to avoid Pydantic validation errors
-            final_links_list = []
-            for item in all_links:
-                if isinstance(item, dict):
-                    url = item.get("href") or item.get("url") or item.get("link") or item.get("src")
-                    final_links_list.append(str(url) if url else str(item))
-                else:
-                    final_links_list.append(str(item))
-            
-            # One more safety pass - force everything to string
-            final_links_list = [str(l) for l in final_links_list]
-            
-            logger.info(f"Final links count: {len(final_links_list)}, all strings: {all(isinstance(l, str) for l in final_links_list)}")
-            
-            response_data = {
-                "url": str(request.url),
-                "markdown": markdown_content,
-                "html": html_content,
-                "links": final_links_list,  # Use final_links_list which is guaranteed to be strings
-                "media": {
-                    "images": image_urls,
-                    "videos": video_urls
-                },
-                "metadata": {
-                    "title": metadata_dict.get("title", ""),
-                    "description": metadata_dict.get("description", ""),
-                    "keywords": metadata_dict.get("keywords", []),
-                    "language": metadata_dict.get("language", ""),
-                },
-                "screenshot": result.screenshot if request.screenshot and hasattr(result, 'screenshot') else None,
-                "timestamp": datetime.utcnow().isoformat()
-            }
-            
-            # Cache result
-            await set_cached_result(cache_key, response_data)
-            
-            return CrawlResponse(**response_data)
+        
+        # Process result
+        if not result.success:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Crawl failed: {result.error_message}"
+            )
+        
+        # Normalize the result in a worker thread so large pages don't block the event loop
+        response_data = await asyncio.to_thread(_postprocess, result, request)
+        
+        # Validate before caching - cache hits are served without re-validation
+        response = CrawlResponse(**response_data)
+        await set_cached_result(cache_key, response.model_dump())
+        
+        return response
             
     except Exception as e:
         logger.error(f"Crawl error for {request.url}: {e}")
@@ -364,7 +526,7 @@ async def health_check():
     
     return HealthResponse(
         status="healthy" if redis_ok else "degraded",
-        timestamp=datetime.utcnow().isoformat(),
+        timestamp=_now_iso(),
         redis_connected=redis_ok
     )
 
@@ -380,11 +542,20 @@ async def crawl_url(request: CrawlRequest):
     - **wait_for**: CSS selector to wait for before extraction
     - **timeout**: Request timeout in seconds
     """
-    logger.info(f"Crawling URL: {request.url}")
+    logger.info("Crawling URL: %s", request.url)
     return await perform_crawl(request)
 
+async def _run_batch(crawl_requests: List[CrawlRequest]):
+    """Run batch crawls concurrently, bounded by BATCH_CONCURRENCY across all batches"""
+    async def crawl_one(crawl_req: CrawlRequest):
+        async with _batch_semaphore:
+            return await perform_crawl(crawl_req)
+
+    # Failures are already logged in perform_crawl; results land in the cache
+    await asyncio.gather(*(crawl_one(r) for r in crawl_requests), return_exceptions=True)
+
 @app.post("/crawl/batch")
-async def batch_crawl(request: BatchCrawlRequest, background_tasks: BackgroundTasks):
+async def batch_crawl(request: BatchCrawlRequest):
     """
     Crawl multiple URLs in batch
     
@@ -396,29 +567,43 @@ async def batch_crawl(request: BatchCrawlRequest, background_tasks: BackgroundTa
             detail="Maximum 50 URLs allowed per batch"
         )
     
-    job_ids = []
+    # Generate job IDs (cache keys) up front
+    cache_params = {
+        "extraction": request.extraction_strategy,
+        "chunking": request.chunking_strategy,
+        "screenshot": request.screenshot
+    }
+    cache_keys = [generate_cache_key(str(url), cache_params) for url in request.urls]
+    
+    # One round-trip for the whole batch - already cached URLs need no crawl
+    cached = await get_cached_keys(cache_keys)
     
-    for url in request.urls:
-        # Create individual crawl request
-        crawl_req = CrawlRequest(
+    job_ids = [
+        {
+            "url": str(url),
+            "job_id": job_id,
+            "status": "cached" if job_id in cached else "queued"
+        }
+        for url, job_id in zip(request.urls, cache_keys)
+    ]
+    
+    crawl_requests = [
+        CrawlRequest(
             url=url,
             extraction_strategy=request.extraction_strategy,
             chunking_strategy=request.chunking_strategy,
             screenshot=request.screenshot,
             timeout=request.timeout
         )
-        
-        # Generate job ID (cache key)
-        cache_params = {
-            "extraction": request.extraction_strategy,
-            "chunking": request.chunking_strategy,
-            "screenshot": request.screenshot
-        }
-        job_id = generate_cache_key(str(url), cache_params)
-        job_ids.append({"url": str(url), "job_id": job_id})
-        
-        # Add to background tasks
-        background_tasks.add_task(perform_crawl, crawl_req)
+        for url, job_id in zip(request.urls, cache_keys)
+        if job_id not in cached
+    ]
+    
+    # Run remaining crawls concurrently in the background
+    if crawl_requests:
+        task = asyncio.create_task(_run_batch(crawl_requests))
+        _batch_tasks.add(task)
+        task.add_done_callback(_batch_tasks.discard)
     
     return {
         "status": "processing",
@@ -432,7 +617,7 @@ async def get_result(job_id: str):
     """
     Retrieve crawl result by job ID (cache key)
     """
-    result = await get_cached_result(f"crawl:{job_id}")
+    result = await get_cached_raw(f"crawl:{job_id}")
     
     if not result:
         raise HTTPException(
@@ -440,7 +625,7 @@ async def get_result(job_id: str):
             detail="Result not found or expired"
         )
     
-    return result
+    return Response(content=result, media_type="application/json")
 
 @app.delete("/cache/{job_id}")
 async def clear_cache(job_id: str):
@@ -454,7 +639,11 @@ async def clear_cache(job_id: str):
         )
     
     try:
-        deleted = await redis_client.delete(f"crawl:{job_id}")
+        cache_key = f"crawl:{job_id}"
+        deleted = await redis_client.unlink(cache_key)
+        # Evict from every worker's in-process cache, this one included
+        _forget_local(cache_key)
+        await redis_client.publish(CACHE_INVALIDATION_CHANNEL, cache_key)
         return {
             "status": "success" if deleted else "not_found",
             "job_id": job_id
@@ -3,6 +3,9 @@ Compression module using OpenRouter API to summarize large text responses.
 """
 
 import os
+from typing import Optional
+
+import httpx
 from openai import AsyncOpenAI
 
 OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
@@ -13,13 +16,25 @@ COMPRESSION_PROMPT = os.getenv(
 )
 
 
+_client: Optional[AsyncOpenAI] = None
+
+
 def get_client() -> AsyncOpenAI:
-    if not OPENROUTER_API_KEY:
-        raise ValueError("OPENROUTER_API_KEY environment variable not set")
-    return AsyncOpenAI(
-        base_url="https://openrouter.ai/api/v1",
-        api_key=OPENROUTER_API_KEY,
-    )
+    """Return the shared client, creating it on first use so connections are kept alive."""
+    global _client
+    if _client is None:
+        if not OPENROUTER_API_KEY:
+            raise ValueError("OPENROUTER_API_KEY environment variable not set")
+        _client = AsyncOpenAI(
+            base_url="https://openrouter.ai/api/v1",
+            api_key=OPENROUTER_API_KEY,
+            http_client=httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                timeout=60.0,
+            ),
+        )
+    return _client
 
 
 async def compress(content: str, instruction: str = "summarize briefly") -> str: